@@ -1,14 +1,30 @@
+import calendar
 import json
 import os
 import re
 import hashlib
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 SCRIPT_VERSION = "2026-02-09_force_v4_jina"
 
@@ -23,6 +39,24 @@ JINA_PREFIX = "https://r.jina.ai/https://"
 PAST_ROUNDS = 2
 FUTURE_ROUNDS = 4
 MAX_ROUNDS = 30
+FETCH_WORKERS = 8
+
+# URL-urile etapelor se construiesc o singura data
+ETAPA_URLS = {n: LPF2_ETAPA_URL.format(n=n) for n in range(1, MAX_ROUNDS + 1)}
+
+# COMPACT_JSON=1 -> fara indentare in fisierele scrise (mai putini bytes)
+COMPACT_JSON = bool(os.environ.get("COMPACT_JSON"))
+
+# EMIT_MSGPACK=1 -> scriem si un .msgpack langa fiecare JSON (citire rapida in aval)
+EMIT_MSGPACK = bool(os.environ.get("EMIT_MSGPACK"))
+
+# EMIT_GZIP=1 -> scriem si un .json.gz precomprimat (CDN-ul nu mai comprima la cerere)
+EMIT_GZIP = bool(os.environ.get("EMIT_GZIP"))
+
+# cache local pentru GET-uri conditionale (ETag/Last-Modified) intre rulari
+HTTP_CACHE_DIR = os.path.join(".cache", "http")
+# LPF2_CACHE=0 -> fara cache (GET-uri complete la fiecare rulare)
+HTTP_CACHE = os.environ.get("LPF2_CACHE", "1") != "0"
 
 UA = "Mozilla/5.0 (compatible; superliga-api-bot/4.4; +https://github.com/spyderu/superliga-api)"
 
@@ -51,19 +85,60 @@ def make_session() -> requests.Session:
 
 SESSION = make_session()
 
+def http_cache_path(url: str) -> str:
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+def response_text(r: requests.Response) -> str:
+    # fara charset declarat, requests ar ghici encoding-ul (lent, si latin-1 pe text/html);
+    # paginile LPF2 / jina sunt UTF-8, deci decodam direct o singura data
+    if "charset=" not in r.headers.get("Content-Type", "").lower():
+        return r.content.decode("utf-8", errors="replace")
+    return r.text
+
 def fetch_raw(url: str) -> str:
-    r = SESSION.get(url, timeout=(15, 30))
+    """
+    GET conditional: trimitem ETag/Last-Modified din cache-ul de pe disc,
+    iar la 304 intoarcem body-ul salvat la rularea anterioara.
+    """
+    cache_path = http_cache_path(url)
+    cached = read_existing(cache_path) if HTTP_CACHE else None
+    if not isinstance(cached, dict):
+        cached = None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    r = SESSION.get(url, headers=headers, timeout=(15, 30))
+    if r.status_code == 304 and cached:
+        return cached["body"]
     r.raise_for_status()
-    return r.text
+    text = response_text(r)
+
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if HTTP_CACHE and (etag or last_modified):
+        write_json(cache_path, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": text,
+        })
+    return text
+
+# Dacă LPF2 dă "empty shell" / blocaj, de obicei lipsesc complet cuvintele astea.
+# Noi avem nevoie de luni românești + "pozitia" sau "etapa".
+BLOCKED_NEEDLES = ("februarie", "ianuarie", "martie", "pozitia", "etapa")
 
 def looks_blocked_or_empty(text: str) -> bool:
-    t = text.lower()
-    # Dacă LPF2 dă "empty shell" / blocaj, de obicei lipsesc complet cuvintele astea.
-    # Noi avem nevoie de luni românești + "pozitia" sau "etapa".
-    needles = ["februarie", "ianuarie", "martie", "pozitia", "etapa"]
-    found = sum(1 for n in needles if n in t)
     # prea scurt sau aproape nimic relevant -> fallback
-    return len(text) < 5000 or found == 0
+    if len(text) < 5000:
+        return True
+    t = text.lower()
+    return not any(n in t for n in BLOCKED_NEEDLES)
 
 def fetch_html_with_fallback(url: str) -> Tuple[str, str]:
     """
@@ -85,39 +160,89 @@ def fetch_html_with_fallback(url: str) -> Tuple[str, str]:
 def iso_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def stable_dumps(obj) -> str:
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-
-def sha256_str(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def dumps_json(obj) -> bytes:
+    """Exact bytes-ii scrisi pe disc (indentat, sau compact cu COMPACT_JSON)."""
+    if orjson is not None:
+        # orjson scoate direct bytes UTF-8, acelasi format ca json.dump(indent=2)
+        option = orjson.OPT_NON_STR_KEYS
+        if not COMPACT_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if COMPACT_JSON:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def write_bytes(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # scriem in .tmp + os.replace -> nimeni nu vede un JSON scris pe jumatate
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 def write_json(path: str, obj) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    write_bytes(path, dumps_json(obj))
 
-def write_json_if_changed(path: str, obj) -> bool:
-    new_str = stable_dumps(obj)
-    new_hash = sha256_str(new_str)
+def write_msgpack(path: str, obj) -> None:
+    write_bytes(path, msgpack.packb(obj, use_bin_type=True))
 
-    if os.path.exists(path):
+def write_gzip(path: str, json_path: str) -> None:
+    with open(json_path, "rb") as f:
+        data = f.read()
+    # mtime=0 -> acelasi JSON da acelasi .gz (fara diff inutil in git)
+    write_bytes(path, gzip.compress(data, compresslevel=6, mtime=0))
+
+def write_json_if_changed(path: str, obj, ignore_keys: Tuple[str, ...] = (), force: bool = False) -> bool:
+    """
+    ignore_keys: chei top-level ignorate la comparatie (ex. "generated_utc" din meta),
+    ca o rulare fara date noi sa nu rescrie fisierul doar pentru timestamp.
+    force: scrie oricum (ex. meta cand s-a schimbat unul din fisierele de date).
+    """
+    data = dumps_json(obj)
+
+    old_bytes = None
+    if not force:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                old_obj = json.load(f)
-            old_str = stable_dumps(old_obj)
-            old_hash = sha256_str(old_str)
-            if old_hash == new_hash:
-                return False
-        except Exception:
-            pass
-
-    write_json(path, obj)
-    return True
+            with open(path, "rb") as f:
+                old_bytes = f.read()
+        except OSError:
+            pass  # fisier inexistent -> se scrie
+
+    changed = True
+    if old_bytes is not None:
+        # comparam bytes exacti: alta formatare (ex. COMPACT_JSON comutat) => rescriere
+        changed = old_bytes != data
+        if changed and ignore_keys:
+            # cheile ignorate iau valorile vechi, restul trebuie sa fie identic pe byte
+            try:
+                old_obj = orjson.loads(old_bytes) if orjson is not None else json.loads(old_bytes)
+            except ValueError:
+                old_obj = None
+            if isinstance(old_obj, dict) and isinstance(obj, dict):
+                kept = {**obj, **{k: old_obj[k] for k in ignore_keys if k in old_obj}}
+                changed = dumps_json(kept) != old_bytes
+
+    if changed:
+        write_bytes(path, data)
+
+    if EMIT_MSGPACK:
+        mp_path = os.path.splitext(path)[0] + ".msgpack"
+        if changed or not os.path.exists(mp_path):
+            write_msgpack(mp_path, obj)
+
+    if EMIT_GZIP:
+        gz_path = path + ".gz"
+        if changed or not os.path.exists(gz_path):
+            write_gzip(gz_path, path)
+    return changed
 
 def read_existing(path: str):
     if not os.path.exists(path):
         return None
     try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
@@ -126,89 +251,151 @@ def read_existing(path: str):
 # -------------------------
 # Parsing helpers
 # -------------------------
+RGX_IMAGE = re.compile(r"\bImage\b")
+RGX_RO_DATE = re.compile(r"^\s*(\d{1,2})\s+([A-Za-zăâîșțĂÂÎȘȚ]+)\s+(\d{4})\s*$")
+
 def norm_space(s: str) -> str:
-    s = s.replace("\xa0", " ")
-    s = re.sub(r"\s+", " ", s.strip())
-    return s
+    # str.split() fara argument taie dupa orice spatiu (inclusiv \xa0) direct in C
+    return " ".join(s.split())
 
 def clean_line_for_match(line: str) -> str:
-    line = norm_space(line)
+    # liniile vin deja normalizate din html_to_lines
+    if "Image" not in line:
+        return line
     # LPF2 introduce des "Image" în text
-    line = re.sub(r"\bImage\b", " ", line)
-    line = norm_space(line)
+    line = norm_space(RGX_IMAGE.sub(" ", line))
     if "Image:" in line:
         line = line.split("Image:", 1)[0]
     return norm_space(line)
 
 def parse_ro_datetime(date_str: str, time_str: str) -> Tuple[str, str]:
-    m = re.match(r"^\s*(\d{1,2})\s+([A-Za-zăâîșțĂÂÎȘȚ]+)\s+(\d{4})\s*$", date_str.strip(), re.UNICODE)
+    m = RGX_RO_DATE.match(date_str)
     if not m:
         raise ValueError(f"Bad date: {date_str}")
     dd = int(m.group(1))
     mon = m.group(2).lower()
     yyyy = int(m.group(3))
-    if mon not in RO_MONTH_FULL:
+    month = RO_MONTH_FULL.get(mon)
+    if month is None:
         raise ValueError(f"Unknown month: {mon}")
-    hh, mm = time_str.strip().split(":")
-    dt = datetime(yyyy, RO_MONTH_FULL[mon], dd, int(hh), int(mm))
-    return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+    hh, mm = map(int, time_str.split(":"))
+    # aceleasi verificari pe care le facea datetime(...), fara obiectul in sine
+    if not 1 <= dd <= calendar.monthrange(yyyy, month)[1]:
+        raise ValueError(f"Bad day: {date_str}")
+    if hh >= 24 or mm >= 60:
+        raise ValueError(f"Bad time: {time_str}")
+    # formatare directa, fara datetime + strftime pentru fiecare meci
+    return f"{yyyy:04d}-{month:02d}-{dd:02d}", f"{hh:02d}:{mm:02d}:00"
+
+TEAM_CUT_MARKERS = ("Caseta", "Rezumatul", "comentariile", "Tweet", "Follow", "Meniu", "Clasamentul", "Pozitia")
+
+# ~16 echipe pe tot sezonul -> o singura instanta de string per nume
+TEAM_NAMES: Dict[str, str] = {}
 
 def cleanup_team(s: str) -> str:
-    s = norm_space(s)
-    for cut in ["Caseta", "Rezumatul", "comentariile", "Tweet", "Follow", "Meniu", "Clasamentul", "Pozitia"]:
+    # vine dintr-o linie deja normalizata -> ajunge strip() la capete
+    s = s.strip()
+    for cut in TEAM_CUT_MARKERS:
         if cut in s:
             s = s.split(cut, 1)[0]
-    return norm_space(s)
+    s = s.rstrip()
+    return TEAM_NAMES.setdefault(s, s)
+
+# toate cheile unui meci, in ordinea din JSON; constantele sunt deja completate,
+# restul se suprascriu (copy() pe un dict gata facut e mai ieftin ca un literal nou)
+MATCH_TEMPLATE = {
+    "idEvent": None,
+    "season": SEASON,
+    "round": None,
+    "dateEvent": None,
+    "strTime": None,
+    "kickoff_raw": None,
+    "home": None,
+    "away": None,
+    "status": None,
+    "score": None,
+    "homeTeam": None,
+    "awayTeam": None,
+    "played": None,
+    "intHomeScore": None,
+    "intAwayScore": None,
+    "source": "LPF2",
+    "source_league_id": "lpf2.ro",
+}
 
 def match_obj(round_no: int, dateEvent: str, timeEvent: str,
               home: str, away: str, hs: Optional[int], as_: Optional[int]) -> Dict:
     status = "scheduled" if (hs is None or as_ is None) else "finished"
     played = status == "finished"
-    return {
-        "idEvent": None,
-        "season": SEASON,
-        "round": str(round_no),
-        "dateEvent": dateEvent,
-        "strTime": timeEvent,
-        "kickoff_raw": f"{dateEvent}T{timeEvent}",
-        "home": home,
-        "away": away,
-        "status": status,
-        "score": {"home": hs, "away": as_},
-        "homeTeam": home,
-        "awayTeam": away,
-        "played": played,
-        "intHomeScore": hs,
-        "intAwayScore": as_,
-        "source": "LPF2",
-        "source_league_id": "lpf2.ro",
-    }
-
-def extract_lines_from_etapa(round_no: int) -> Tuple[List[str], str]:
-    url = LPF2_ETAPA_URL.format(n=round_no)
+    d = MATCH_TEMPLATE.copy()
+    d["round"] = str(round_no)
+    d["dateEvent"] = dateEvent
+    d["strTime"] = timeEvent
+    d["kickoff_raw"] = f"{dateEvent}T{timeEvent}"
+    d["home"] = d["homeTeam"] = home
+    d["away"] = d["awayTeam"] = away
+    d["status"] = status
+    d["score"] = {"home": hs, "away": as_}
+    d["played"] = played
+    d["intHomeScore"] = hs
+    d["intAwayScore"] = as_
+    return d
+
+# toate nodurile text vizibile (ca BeautifulSoup.get_text), fara script/style
+XPATH_VISIBLE_TEXT = "//text()[not(parent::script) and not(parent::style) and not(parent::template)]"
+
+def html_to_lines(html: str) -> List[str]:
+    if not html.strip():
+        return []
+    # parser nou la fiecare apel: parserele lxml nu se partajeaza intre thread-uri
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        root = lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except lxml.etree.ParserError:
+        # markup fara continut ("<!DOCTYPE html>", doar comentarii) -> "Document is empty"
+        return []
+    # liniile direct din nodurile text, fara un string mare intermediar;
+    # liniile goale dispar dupa norm_space
+    return [
+        s
+        for t in root.xpath(XPATH_VISIBLE_TEXT, smart_strings=False)
+        for s in map(norm_space, t.splitlines())
+        if s
+    ]
+
+@lru_cache(maxsize=MAX_ROUNDS)
+def extract_lines_from_etapa(round_no: int) -> Tuple[Tuple[str, ...], str]:
+    """
+    Memoizat pe durata rularii: etapa curenta e ceruta de cautarea binara,
+    de clasament si de meciuri -> un singur fetch + parse.
+    """
+    url = ETAPA_URLS.get(round_no) or LPF2_ETAPA_URL.format(n=round_no)
     html, method = fetch_html_with_fallback(url)
 
-    # dacă vine prin jina, e deja text-ish; tot folosim BeautifulSoup ca să uniformizăm
-    soup = BeautifulSoup(html, "lxml")
-    lines = [ln for ln in soup.get_text("\n").splitlines() if ln.strip()]
-    lines = [norm_space(ln) for ln in lines]
-    return lines, method
+    # dacă vine prin jina, e deja text-ish; tot trecem prin lxml ca să uniformizăm
+    return tuple(html_to_lines(html)), method
 
 DATE_TIME = r"(\d{1,2}\s+[A-Za-zăâîșțĂÂÎȘȚ]+\s+\d{4}),\s*(\d{1,2}:\d{2})"
+# ordinea conteaza: intai "A 2-1 B" (terminat) pe toata linia, abia apoi "A - B" (programat);
+# altfel un " - " din text lipit inaintea scorului ar face programat un meci jucat
 RGX_FINISHED_SEARCH = re.compile(
-    DATE_TIME + r".*?([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s+(\d{1,2})-(\d{1,2})\s+([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+)",
-    re.UNICODE
+    DATE_TIME + r".*?([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s+(\d{1,2})-(\d{1,2})\s+([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+)"
 )
 RGX_SCHEDULED_SEARCH = re.compile(
-    DATE_TIME + r".*?([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s+-\s+([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+)",
-    re.UNICODE
+    DATE_TIME + r".*?([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s+-\s+([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+)"
 )
 
+DEBUG_NEEDLES = ("februarie", "ianuarie", "pozitia", "etapa", "2026")
+
 def extract_matches_from_round(round_no: int) -> Tuple[List[Dict], str, List[str]]:
     lines, method = extract_lines_from_etapa(round_no)
     out: List[Dict] = []
+    seen = set()
 
     for raw in lines:
+        # prefiltru ieftin: orice linie de meci are "zi luna an, HH:MM"
+        if "," not in raw or ":" not in raw:
+            continue
         line = clean_line_for_match(raw)
         if not line:
             continue
@@ -216,110 +403,143 @@ def extract_matches_from_round(round_no: int) -> Tuple[List[Dict], str, List[str
         m = RGX_FINISHED_SEARCH.search(line)
         if m:
             date_str, time_str, home, hs, as_, away = m.groups()
-            dateEvent, timeEvent = parse_ro_datetime(date_str, time_str)
-            out.append(match_obj(round_no, dateEvent, timeEvent,
-                                 cleanup_team(home), cleanup_team(away),
-                                 int(hs), int(as_)))
-            continue
-
-        m = RGX_SCHEDULED_SEARCH.search(line)
-        if m:
+            hs, as_ = int(hs), int(as_)
+        else:
+            m = RGX_SCHEDULED_SEARCH.search(line)
+            if not m:
+                continue
             date_str, time_str, home, away = m.groups()
+            hs = as_ = None
+
+        try:
             dateEvent, timeEvent = parse_ro_datetime(date_str, time_str)
-            out.append(match_obj(round_no, dateEvent, timeEvent,
-                                 cleanup_team(home), cleanup_team(away),
-                                 None, None))
-            continue
+        except ValueError:
+            continue  # data/ora imposibila (ex. "31 Februarie") -> linia nu e un meci valid
+        home, away = cleanup_team(home), cleanup_team(away)
 
-    # dedupe
-    uniq = []
-    seen = set()
-    for mm in out:
-        key = (mm["round"], mm["dateEvent"], mm["strTime"], mm["home"], mm["away"])
+        # dedupe la insertie (etapa e aceeasi pentru toata pagina); primul meci gasit ramane
+        key = (dateEvent, timeEvent, home, away)
         if key in seen:
             continue
         seen.add(key)
-        uniq.append(mm)
+        out.append(match_obj(round_no, dateEvent, timeEvent, home, away, hs, as_))
 
     # debug: primele linii utile, ca să vedem ce primește runner-ul
     dbg = []
     for ln in lines[:60]:
-        if any(x in ln.lower() for x in ["februarie", "ianuarie", "pozitia", "etapa", "2026"]):
+        low = ln.lower()
+        if any(x in low for x in DEBUG_NEEDLES):
             dbg.append(ln)
         if len(dbg) >= 20:
             break
 
-    return uniq, method, dbg
+    return out, method, dbg
+
+RGX_STANDINGS_ROW = re.compile(
+    r"^(\d{1,2})\s*([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s*(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})\s+"
+    r"(\d{1,3})-(\d{1,3})\s*\(\s*([-+]?\d+)\s*\)\s*(\d{1,3})\s*\(\s*(\d{1,3})\s*\)\s*\(\s*([-+]?\d+)\s*\)\s*$"
+)
+
+# cheile unui rand de clasament, in ordinea din standings.json
+STANDINGS_KEYS = ("position", "team", "played", "win", "draw", "loss", "gf", "ga", "gd", "points", "adevar")
+
+STANDINGS_HEADER = "pozitia echipa meciuri victorii"
 
 def extract_standings_from_round(round_no: int) -> Tuple[List[Dict], str]:
     lines, method = extract_lines_from_etapa(round_no)
 
     start = None
+    n = len(STANDINGS_HEADER)
     for i, ln in enumerate(lines):
-        if norm_space(ln).lower().startswith("pozitia echipa meciuri victorii"):
+        # lower() doar pe prefix, nu pe toata linia
+        if ln[:n].lower() == STANDINGS_HEADER:
             start = i + 1
             break
     if start is None:
         return [], method
 
-    rgx = re.compile(
-        r"^(\d{1,2})\s*([A-Za-z0-9ăâîșțĂÂÎȘȚ .'-]+?)\s*(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})\s+"
-        r"(\d{1,3})-(\d{1,3})\s*\(\s*([-+]?\d+)\s*\)\s*(\d{1,3})\s*\(\s*(\d{1,3})\s*\)\s*\(\s*([-+]?\d+)\s*\)\s*$",
-        re.UNICODE
-    )
-
     standings: List[Dict] = []
     for ln in lines[start:]:
-        ln = norm_space(ln)
-        if ln.lower().startswith("playout"):
+        # randurile incep cu pozitia; restul (ex. "Playout") nu mai trec prin regex
+        if not ln[:1].isdigit():
             continue
 
-        m = rgx.match(ln)
+        m = RGX_STANDINGS_ROW.match(ln)
         if not m:
             continue
 
-        pos = int(m.group(1))
+        pos, played, win, draw, loss, gf, ga, points, adevar = map(int, m.group(1, 3, 4, 5, 6, 7, 8, 10, 12))
         team = cleanup_team(m.group(2))
-        played = int(m.group(3))
-        win = int(m.group(4))
-        draw = int(m.group(5))
-        loss = int(m.group(6))
-        gf = int(m.group(7))
-        ga = int(m.group(8))
-        points = int(m.group(10))
-        adevar = int(m.group(12))
-
-        standings.append({
-            "position": pos,
-            "team": team,
-            "played": played,
-            "win": win,
-            "draw": draw,
-            "loss": loss,
-            "gf": gf,
-            "ga": ga,
-            "gd": gf - ga,
-            "points": points,
-            "adevar": adevar,
-        })
+
+        standings.append(dict(zip(STANDINGS_KEYS, (
+            pos, team, played, win, draw, loss, gf, ga, gf - ga, points, adevar,
+        ))))
 
         if len(standings) >= 16:
             break
 
-    standings.sort(key=lambda x: x["position"])
+    standings.sort(key=itemgetter("position"))
     return standings, method
 
+def has_16_standings(round_no: int) -> Optional[bool]:
+    """
+    True/False doar cand pagina chiar a fost citita (sau 404 = etapa inexistenta).
+    None = eroare tranzitorie de fetch: nu stim, deci nu are voie sa mute cautarea.
+    """
+    try:
+        st, _ = extract_standings_from_round(round_no)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return False
+        return None
+    except Exception:
+        return None
+    return len(st) == 16
+
 def find_latest_round_with_16_standings() -> Tuple[int, str]:
-    for r in range(MAX_ROUNDS, 0, -1):
-        try:
-            st, _ = extract_standings_from_round(r)
-            if len(st) == 16:
+    """
+    Etapele cu clasament complet formeaza un prefix 1..R, deci cautam ultima
+    etapa R pe intervale: la fiecare pas verificam in paralel pana la
+    FETCH_WORKERS etape echidistante -> 2 runde de request-uri in loc de
+    ~log2(MAX_ROUNDS) fetch-uri secventiale.
+    Doar un raspuns sigur (pagina citita sau 404) muta capetele intervalului;
+    un probe care esueaza si la a doua incercare opreste cautarea si coboram
+    liniar de la hi, ca scanarea initiala.
+    """
+    lo, hi = 0, MAX_ROUNDS  # lo = ultima etapa ok gasita (0 = niciuna)
+    unsure = False
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        while lo < hi and not unsure:
+            span = hi - lo
+            if span <= FETCH_WORKERS:
+                probes = list(range(lo + 1, hi + 1))
+            else:
+                probes = [lo + span * i // (FETCH_WORKERS + 1) for i in range(1, FETCH_WORKERS + 1)]
+            for r, ok in zip(probes, ex.map(has_16_standings, probes)):
+                if ok is None:
+                    ok = has_16_standings(r)  # a doua incercare, secvential
+                if ok is None:
+                    unsure = True
+                    break
+                if ok:
+                    lo = r
+                else:
+                    hi = r - 1
+                    break
+
+    if unsure:
+        for r in range(hi, lo, -1):
+            if has_16_standings(r):
                 return r, "latest_ok"
-        except Exception:
-            continue
+    if lo:
+        return lo, "latest_ok"
     return 26, "forced_26"  # fallback pragmatic
 
 def main():
+    if EMIT_MSGPACK and msgpack is None:
+        # altfel flag-ul ar fi ignorat in tacere si .msgpack-urile n-ar mai aparea
+        raise RuntimeError("EMIT_MSGPACK=1 dar pachetul msgpack nu e instalat (pip install msgpack)")
+
     os.makedirs(OUTDIR, exist_ok=True)
 
     current_round, cr_status = find_latest_round_with_16_standings()
@@ -337,18 +557,23 @@ def main():
     round_notes = []
     debug_snippet = {}
 
-    for r in range(start_r, end_r + 1):
-        ms, method, dbg = extract_matches_from_round(r)
+    # etapele sunt independente -> le aducem in paralel pe acelasi SESSION
+    rounds = list(range(start_r, end_r + 1))
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(rounds))) as ex:
+        parsed_rounds = list(ex.map(extract_matches_from_round, rounds))
+
+    for r, (ms, method, dbg) in zip(rounds, parsed_rounds):
         round_notes.append({str(r): f"{method}:{len(ms)}"})
         if r == current_round and dbg:
             debug_snippet[str(r)] = dbg
         all_matches.extend(ms)
 
     if len(all_matches) >= 8:
-        fixtures = [m for m in all_matches if m["status"] == "scheduled"]
-        results = [m for m in all_matches if m["status"] == "finished"]
-        fixtures.sort(key=lambda x: (x["dateEvent"], x["strTime"], x["home"], x["away"]))
-        results.sort(key=lambda x: (x["dateEvent"], x["strTime"]), reverse=True)
+        fixtures, results = [], []
+        for m in all_matches:
+            (fixtures if m["status"] == "scheduled" else results).append(m)
+        fixtures.sort(key=itemgetter("dateEvent", "strTime", "home", "away"))
+        results.sort(key=itemgetter("dateEvent", "strTime"), reverse=True)
         matches_status = f"ok_total:{len(all_matches)}"
     else:
         fixtures = read_existing(os.path.join(OUTDIR, "fixtures.json")) or []
@@ -376,10 +601,15 @@ def main():
         "debug": debug_snippet
     }
 
-    write_json_if_changed(os.path.join(OUTDIR, "standings.json"), standings)
-    write_json_if_changed(os.path.join(OUTDIR, "fixtures.json"), fixtures)
-    write_json_if_changed(os.path.join(OUTDIR, "results.json"), results)
-    write_json_if_changed(os.path.join(OUTDIR, "meta.json"), meta)
+    data_changed = any([
+        write_json_if_changed(os.path.join(OUTDIR, "standings.json"), standings),
+        write_json_if_changed(os.path.join(OUTDIR, "fixtures.json"), fixtures),
+        write_json_if_changed(os.path.join(OUTDIR, "results.json"), results),
+    ])
+    # generated_utc e nou la fiecare rulare -> meta se rescrie doar daca s-au schimbat
+    # datele sau restul meta; altfel workflow-ul ar face commit la fiecare 30 min
+    write_json_if_changed(os.path.join(OUTDIR, "meta.json"), meta,
+                          ignore_keys=("generated_utc",), force=data_changed)
 
     print("SCRIPT_VERSION:", SCRIPT_VERSION)
     print("OK", meta)